@@ -7,10 +7,18 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import select
 import socket
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from gc2_connect.models import (
     GC2BallStatus,
     GC2ShotData,
@@ -23,20 +31,137 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 921
+RESPONSE_TIMEOUT_S = 5.0
 
+# Identical status updates within this window are dropped (TCP_NODELAY means
+# every send is its own packet)
+STATUS_COALESCE_S = 0.02
+# Async status updates wait this long so only the latest one in a burst is sent
+STATUS_DEBOUNCE_S = 0.005
 
-class GSProClient:
-    """Client for GSPro Open Connect API v1."""
+# Shared decoder for splitting buffered responses (raw_decode is stateless)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a message dict to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _is_truncated(text: str, error: json.JSONDecodeError) -> bool:
+    """Whether a decode error means the object is still arriving, not malformed."""
+    # Malformed data fails before a later closing brace; truncated data has none
+    return "}" not in text[error.pos :] or error.msg.startswith("Unterminated string")
+
+
+def _pop_json(buffer: bytearray) -> Any | None:
+    """Remove and return the first complete JSON object in buffer.
+
+    Returns None if no complete object has arrived yet, leaving any partial
+    object in the buffer for the next read to complete.
+
+    Raises:
+        json.JSONDecodeError: If the first object is malformed. It is dropped
+            from the buffer first so later responses can still be read.
+    """
+    start = buffer.find(b"{")
+    if start < 0:
+        buffer.clear()  # Nothing but whitespace/garbage
+        return None
+    del buffer[:start]
+
+    if orjson is not None:
+        try:
+            obj = orjson.loads(buffer)
+            buffer.clear()
+            return obj
+        except orjson.JSONDecodeError:
+            pass  # Incomplete, or more than one object buffered; split below
+
+    # surrogateescape keeps a 1:1 byte mapping for a split multi-byte character
+    text = buffer.decode("utf-8", "surrogateescape")
+    try:
+        obj, end = _JSON_DECODER.raw_decode(text)
+    except json.JSONDecodeError as e:
+        if _is_truncated(text, e):
+            return None
+        next_start = buffer.find(b"{", 1)
+        if next_start > 0:
+            del buffer[:next_start]
+        else:
+            buffer.clear()
+        raise
+    del buffer[: len(text[:end].encode("utf-8", "surrogateescape"))]
+    return obj
+
+
+# Options for the ball-less messages; shared because they never change
+_HEARTBEAT_OPTIONS = GSProShotOptions(
+    ContainsBallData=False,
+    ContainsClubData=False,
+    LaunchMonitorIsReady=True,
+    IsHeartBeat=True,
+)
+_STATUS_OPTIONS = {
+    (is_ready, ball_detected): GSProShotOptions(
+        ContainsBallData=False,
+        ContainsClubData=False,
+        LaunchMonitorIsReady=is_ready,
+        LaunchMonitorBallDetected=ball_detected,
+        IsHeartBeat=False,
+    )
+    for is_ready in (True, False)
+    for ball_detected in (True, False)
+}
+
+
+def _without(callbacks: tuple[Any, ...], callback: Any) -> tuple[Any, ...]:
+    """Return callbacks minus the first occurrence of callback, if present."""
+    if callback not in callbacks:
+        return callbacks
+    index = callbacks.index(callback)
+    return callbacks[:index] + callbacks[index + 1 :]
+
+
+def _build_template(options: GSProShotOptions) -> tuple[bytes, bytes]:
+    """Pre-serialize a ball-less message, split around the ShotNumber value.
+
+    Returns:
+        (prefix, suffix) such that prefix + str(shot_number) + suffix is the
+        encoded message for any shot number.
+    """
+    encoded = _dumps(GSProShotMessage(ShotNumber=0, ShotDataOptions=options).to_dict())
+    marker = b'"ShotNumber":'
+    start = encoded.index(marker) + len(marker)
+    return encoded[:start], encoded[start + 1 :]
+
+
+class _GSProClientBase:
+    """Connection state and message handling shared by both GSPro clients."""
 
     def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
         self.host = host
         self.port = port
-        self._socket: socket.socket | None = None
         self._connected = False
         self._shot_number = 0
+        self._last_status_key: tuple[bool, bool] | None = None
+        self._last_status_ts = 0.0
+        self._pending_status: GC2BallStatus | None = None
         self._current_player: dict[str, Any] | None = None
-        self._response_callbacks: list[Callable[[GSProResponse], None]] = []
-        self._disconnect_callbacks: list[Callable[[], None]] = []
+        # Received bytes not yet parsed; responses may span or share TCP reads
+        self._rx_buf = bytearray()
+        # Immutable tuples, replaced on add/remove, so notifying can iterate
+        # without copying even if a callback unregisters itself
+        self._response_callbacks: tuple[Callable[[GSProResponse], None], ...] = ()
+        self._disconnect_callbacks: tuple[Callable[[], None], ...] = ()
+
+        # Heartbeat/status payloads only vary by shot number, so serialize them once
+        self._heartbeat_template = _build_template(_HEARTBEAT_OPTIONS)
+        self._status_templates = {
+            key: _build_template(options) for key, options in _STATUS_OPTIONS.items()
+        }
 
     @property
     def is_connected(self) -> bool:
@@ -52,11 +177,10 @@ class GSProClient:
 
     def add_response_callback(self, callback: Callable[[GSProResponse], None]) -> None:
         """Add a callback for GSPro responses."""
-        self._response_callbacks.append(callback)
+        self._response_callbacks += (callback,)
 
     def remove_response_callback(self, callback: Callable[[GSProResponse], None]) -> None:
-        if callback in self._response_callbacks:
-            self._response_callbacks.remove(callback)
+        self._response_callbacks = _without(self._response_callbacks, callback)
 
     def _notify_response(self, response: GSProResponse) -> None:
         """Notify all callbacks of a response."""
@@ -68,12 +192,11 @@ class GSProClient:
 
     def add_disconnect_callback(self, callback: Callable[[], None]) -> None:
         """Add a callback for connection loss events."""
-        self._disconnect_callbacks.append(callback)
+        self._disconnect_callbacks += (callback,)
 
     def remove_disconnect_callback(self, callback: Callable[[], None]) -> None:
         """Remove a disconnect callback."""
-        if callback in self._disconnect_callbacks:
-            self._disconnect_callbacks.remove(callback)
+        self._disconnect_callbacks = _without(self._disconnect_callbacks, callback)
 
     def _notify_disconnect(self) -> None:
         """Notify all callbacks of a disconnection."""
@@ -83,15 +206,92 @@ class GSProClient:
             except Exception as e:
                 logger.error(f"Disconnect callback error: {e}")
 
+    def _claim_status_send(self, key: tuple[bool, bool]) -> bool:
+        """Record a status send, or return False if it duplicates a recent one."""
+        now = time.monotonic()
+        if key == self._last_status_key and now - self._last_status_ts < STATUS_COALESCE_S:
+            return False  # Duplicate of a status GSPro just received
+
+        logger.debug("Sending status: ready=%s, ball_detected=%s", *key)
+        self._last_status_key = key
+        self._last_status_ts = now
+        return True
+
+    async def _debounce_status(self, status: GC2BallStatus) -> GC2BallStatus | None:
+        """Wait out the debounce window and return the newest status to send.
+
+        Returns None to calls whose status was superseded by an earlier
+        pending call, which will send the latest one instead.
+        """
+        already_pending = self._pending_status is not None
+        self._pending_status = status
+        if already_pending:
+            return None
+
+        try:
+            await asyncio.sleep(STATUS_DEBOUNCE_S)
+        finally:
+            # Always hand off, or a cancelled wait would block every later call
+            latest, self._pending_status = self._pending_status, None
+        return latest
+
+    def _render_template(self, template: tuple[bytes, bytes]) -> bytes:
+        """Fill the current shot number into a pre-serialized message."""
+        prefix, suffix = template
+        return b"%s%d%s" % (prefix, self._shot_number, suffix)
+
+    def _handle_socket_error(self, error: OSError) -> None:
+        """Mark the connection as lost and notify listeners once."""
+        logger.error(f"Socket error: {error}")
+        was_connected = self._connected
+        self._connected = False
+        if was_connected:
+            logger.error("GSPro connection lost!")
+            self._notify_disconnect()
+
+    def _handle_response(self, response_json: dict[str, Any]) -> GSProResponse:
+        """Parse a shot response, track player info, and notify callbacks."""
+        response = GSProResponse.from_dict(response_json)
+
+        logger.debug("Received: %s", response_json)
+
+        # Update player info if received
+        if response.Code == 201 and response.Player:
+            self._current_player = response.Player
+            logger.info(f"Player info: {response.Player}")
+
+        self._notify_response(response)
+        return response
+
+
+class GSProClient(_GSProClientBase):
+    """Client for GSPro Open Connect API v1."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        super().__init__(host, port)
+        self._socket: socket.socket | None = None
+        # Single worker keeps async sends ordered and off the default executor;
+        # created on first use and shut down again by disconnect()
+        self._executor: ThreadPoolExecutor | None = None
+
     def connect(self) -> bool:
         """Connect to GSPro."""
         try:
             # Use create_connection for cleaner connection handling
-            self._socket = socket.create_connection((self.host, self.port), timeout=5.0)
-            # Set TCP_NODELAY to disable Nagle's algorithm for immediate sends
+            self._socket = socket.create_connection(
+                (self.host, self.port), timeout=RESPONSE_TIMEOUT_S
+            )
+            # Set TCP_NODELAY to disable Nagle's algorithm for immediate sends.
+            # Every message goes out in a single sendall(), so Nagle has nothing
+            # to coalesce; with it enabled a shot sent right after a heartbeat
+            # would wait on GSPro's delayed ACK. Keep new send paths to one
+            # write per message rather than relying on TCP_CORK/MSG_MORE,
+            # which are Linux-only.
             self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-            self._socket.settimeout(5.0)
+            self._socket.settimeout(RESPONSE_TIMEOUT_S)
             self._connected = True
+            self._last_status_key = None
+            self._rx_buf.clear()
             logger.info(f"Connected to GSPro at {self.host}:{self.port}")
 
             # Send initial heartbeat to register with GSPro
@@ -116,11 +316,24 @@ class GSProClient:
                 pass
             self._socket = None
         self._connected = False
+        if self._executor is not None:
+            # Don't wait: disconnect() may itself be running on the worker
+            self._executor.shutdown(wait=False)
+            self._executor = None
         logger.info("Disconnected from GSPro")
 
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking socket call on this client's dedicated worker thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="gspro-client"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
     async def connect_async(self) -> bool:
         """Async version of connect."""
-        return await asyncio.get_event_loop().run_in_executor(None, self.connect)
+        return await self._run_blocking(self.connect)
 
     def send_shot(self, shot: GC2ShotData) -> GSProResponse | None:
         """Send a shot to GSPro."""
@@ -141,17 +354,8 @@ class GSProClient:
         if not self._connected or not self._socket:
             return None
 
-        message = GSProShotMessage(
-            ShotNumber=self._shot_number,
-            ShotDataOptions=GSProShotOptions(
-                ContainsBallData=False,
-                ContainsClubData=False,
-                LaunchMonitorIsReady=True,
-                IsHeartBeat=True,
-            ),
-        )
-
-        return self._send_message(message, expect_response=False)
+        self._send_template(self._heartbeat_template)
+        return None
 
     def send_status(self, status: GC2BallStatus) -> GSProResponse | None:
         """Send ball status update to GSPro.
@@ -167,25 +371,59 @@ class GSProClient:
         if not self._connected or not self._socket:
             return None
 
-        message = GSProShotMessage(
-            ShotNumber=self._shot_number,
-            ShotDataOptions=GSProShotOptions(
-                ContainsBallData=False,
-                ContainsClubData=False,
-                LaunchMonitorIsReady=status.is_ready,
-                LaunchMonitorBallDetected=status.ball_detected,
-                IsHeartBeat=False,
-            ),
-        )
-
-        logger.debug(
-            f"Sending status: ready={status.is_ready}, ball_detected={status.ball_detected}"
-        )
-        return self._send_message(message, expect_response=False)
+        key = (status.is_ready, status.ball_detected)
+        if not self._claim_status_send(key):
+            return None
+
+        self._send_template(self._status_templates[key])
+        return None
 
     async def send_status_async(self, status: GC2BallStatus) -> GSProResponse | None:
-        """Async version of send_status."""
-        return await asyncio.get_event_loop().run_in_executor(None, self.send_status, status)
+        """Async version of send_status.
+
+        Calls arriving within STATUS_DEBOUNCE_S of each other are coalesced so
+        only the most recent status is sent.
+        """
+        latest = await self._debounce_status(status)
+        if latest is None:
+            return None
+        return await self._run_blocking(self.send_status, latest)
+
+    def _send_template(self, template: tuple[bytes, bytes]) -> None:
+        """Send a pre-serialized message that GSPro won't respond to."""
+        if self._socket is None:
+            logger.error("Cannot send message: socket is None")
+            return
+
+        encoded = self._render_template(template)
+        try:
+            self._socket.sendall(encoded)
+            logger.debug("Sent %d bytes: %s", len(encoded), encoded)
+        except OSError as e:
+            self._handle_socket_error(e)
+
+    def _drain_stale(self, sock: socket.socket) -> None:
+        """Discard complete responses that arrived before this request.
+
+        Pending bytes are read into the receive buffer without blocking (a
+        zero-timeout select costs a single syscall when the socket is clean).
+        Only complete objects are dropped; a partial one stays buffered.
+        """
+        while select.select([sock], [], [], 0)[0]:
+            data = sock.recv(4096)
+            if not data:
+                break
+            self._rx_buf += data
+
+        while True:
+            try:
+                stale = _pop_json(self._rx_buf)
+            except json.JSONDecodeError as e:
+                logger.debug("Discarded malformed stale data: %s", e)
+                continue
+            if stale is None:
+                break
+            logger.debug("Discarded stale response: %s", stale)
 
     def _send_message(
         self, message: GSProShotMessage, expect_response: bool = True
@@ -204,64 +442,46 @@ class GSProClient:
 
         try:
             # Clear any buffered data before sending (stale responses)
-            sock.setblocking(False)
-            try:
-                while True:
-                    stale = sock.recv(4096)
-                    if stale:
-                        logger.debug(f"Cleared {len(stale)} bytes of stale buffer data")
-                    else:
-                        break
-            except BlockingIOError:
-                pass  # No data to clear, good
-            finally:
-                sock.setblocking(True)
+            if expect_response:
+                self._drain_stale(sock)
+            # A partial object still buffered started before this request
+            stale_partial = bool(self._rx_buf)
 
             # Send JSON message
-            json_data = json.dumps(message.to_dict())
-            encoded = json_data.encode("utf-8")
+            encoded = _dumps(message.to_dict())
             sock.sendall(encoded)
-            logger.debug(f"Sent {len(encoded)} bytes: {json_data}")
+            logger.debug("Sent %d bytes: %s", len(encoded), encoded)
 
             if not expect_response:
                 return None
 
-            # Receive response
-            sock.settimeout(5.0)
+            # Receive response (socket keeps the 5s timeout set in connect).
+            # Read until one complete object is buffered; anything after it
+            # stays in the buffer instead of being dropped.
             logger.debug("Waiting for response...")
-            response_data = sock.recv(4096)
-
-            if not response_data:
-                logger.warning("Empty response from GSPro")
-                return None
-
-            response_str = response_data.decode("utf-8")
-
-            # Parse only the first JSON object (handle concatenated responses)
-            decoder = json.JSONDecoder()
-            response_json, _ = decoder.raw_decode(response_str)
-            response = GSProResponse.from_dict(response_json)
-
-            logger.debug(f"Received: {response_json}")
-
-            # Update player info if received
-            if response.Code == 201 and response.Player:
-                self._current_player = response.Player
-                logger.info(f"Player info: {response.Player}")
+            while True:
+                response_json = _pop_json(self._rx_buf)
+                if response_json is not None:
+                    if not stale_partial:
+                        break
+                    logger.debug("Discarded stale response: %s", response_json)
+                    stale_partial = False
+                    continue
+                response_data = sock.recv(4096)
+                if not response_data:
+                    logger.warning("Empty response from GSPro")
+                    return None
+                self._rx_buf += response_data
 
-            self._notify_response(response)
-            return response
+            return self._handle_response(response_json)
 
         except TimeoutError:
             logger.warning("Timeout waiting for GSPro response")
+            # Whatever is buffered never parsed; don't let it block later responses
+            self._rx_buf.clear()
             return None
         except OSError as e:
-            logger.error(f"Socket error: {e}")
-            was_connected = self._connected
-            self._connected = False
-            if was_connected:
-                logger.error("GSPro connection lost!")
-                self._notify_disconnect()
+            self._handle_socket_error(e)
             return None
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON response: {e}")
@@ -269,4 +489,174 @@ class GSProClient:
 
     async def send_shot_async(self, shot: GC2ShotData) -> GSProResponse | None:
         """Async version of send_shot."""
-        return await asyncio.get_event_loop().run_in_executor(None, self.send_shot, shot)
+        return await self._run_blocking(self.send_shot, shot)
+
+
+class AsyncGSProClient(_GSProClientBase):
+    """asyncio-native client for GSPro Open Connect API v1.
+
+    Keeps a persistent StreamReader/StreamWriter pair instead of running the
+    blocking socket calls on a worker thread, so waiting for a shot response
+    doesn't tie up a thread.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        super().__init__(host, port)
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task[None] | None = None
+        self._response_waiter: asyncio.Future[dict[str, Any]] | None = None
+        self._skip_partial = False
+        self._shot_lock = asyncio.Lock()  # One shot/response exchange at a time
+
+    async def connect_async(self) -> bool:
+        """Connect to GSPro, closing any connection this client already has."""
+        if self._writer is not None or self._read_task is not None:
+            # An old read loop would otherwise report its socket closing as
+            # the new connection being lost
+            await self.disconnect_async()
+
+        try:
+            # asyncio enables TCP_NODELAY on TCP transports by default
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), RESPONSE_TIMEOUT_S
+            )
+        except (OSError, TimeoutError) as e:
+            logger.error(f"Failed to connect to GSPro: {e}")
+            return False
+
+        self._connected = True
+        self._last_status_key = None
+        self._rx_buf.clear()
+        self._read_task = asyncio.create_task(self._read_loop(self._reader))
+        logger.info(f"Connected to GSPro at {self.host}:{self.port}")
+
+        # Send initial heartbeat to register with GSPro
+        await self.send_heartbeat_async()
+        return True
+
+    async def disconnect_async(self) -> None:
+        """Disconnect from GSPro."""
+        self._connected = False
+        # Fail an in-flight shot now instead of letting it wait out the timeout
+        if self._response_waiter and not self._response_waiter.done():
+            self._response_waiter.set_exception(
+                ConnectionResetError("Disconnected from GSPro")
+            )
+        if self._read_task:
+            self._read_task.cancel()
+            self._read_task = None
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._reader = None
+            self._writer = None
+        logger.info("Disconnected from GSPro")
+
+    async def send_heartbeat_async(self) -> GSProResponse | None:
+        """Send a heartbeat to GSPro (no response is expected)."""
+        if self._connected:
+            await self._write(self._render_template(self._heartbeat_template))
+        return None
+
+    async def send_status_async(self, status: GC2BallStatus) -> GSProResponse | None:
+        """Send ball status to GSPro, debounced like GSProClient.send_status_async."""
+        latest = await self._debounce_status(status)
+        if latest is None or not self._connected:
+            return None
+
+        key = (latest.is_ready, latest.ball_detected)
+        if self._claim_status_send(key):
+            await self._write(self._render_template(self._status_templates[key]))
+        return None
+
+    async def send_shot_async(self, shot: GC2ShotData) -> GSProResponse | None:
+        """Send a shot to GSPro and wait for its response."""
+        if not self._connected:
+            logger.error("Not connected to GSPro")
+            return None
+
+        async with self._shot_lock:
+            self._shot_number += 1
+            message = GSProShotMessage.from_gc2_shot(shot, self._shot_number)
+            encoded = _dumps(message.to_dict())
+
+            # Anything already received predates this shot and isn't its response
+            self._response_waiter = asyncio.get_running_loop().create_future()
+            self._skip_partial = bool(self._rx_buf)
+            try:
+                if not await self._write(encoded):
+                    return None
+                response_json = await asyncio.wait_for(
+                    self._response_waiter, RESPONSE_TIMEOUT_S
+                )
+            except TimeoutError:
+                logger.warning("Timeout waiting for GSPro response")
+                self._rx_buf.clear()
+                return None
+            except OSError:
+                return None  # Already reported by the read loop
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON response: {e}")
+                return None
+            finally:
+                self._response_waiter = None
+
+            return self._handle_response(response_json)
+
+    async def _write(self, encoded: bytes) -> bool:
+        """Write one message; returns False if the connection was lost."""
+        if self._writer is None:
+            return False
+        try:
+            self._writer.write(encoded)
+            await self._writer.drain()
+        except OSError as e:
+            self._handle_socket_error(e)
+            return False
+        logger.debug("Sent %d bytes: %s", len(encoded), encoded)
+        return True
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        """Buffer incoming data and hand complete responses to a waiting shot."""
+        try:
+            while data := await reader.read(4096):
+                self._rx_buf += data
+                while True:
+                    try:
+                        response_json = _pop_json(self._rx_buf)
+                    except json.JSONDecodeError as e:
+                        self._dispatch_error(e)
+                        continue
+                    if response_json is None:
+                        break
+                    self._dispatch_response(response_json)
+            error: OSError = ConnectionResetError("GSPro closed the connection")
+        except OSError as e:
+            error = e
+
+        if self._response_waiter and not self._response_waiter.done():
+            self._response_waiter.set_exception(error)
+        self._handle_socket_error(error)
+
+    def _dispatch_response(self, response_json: dict[str, Any]) -> None:
+        """Resolve the pending shot with a response, or drop an unsolicited one."""
+        waiter = self._response_waiter
+        if waiter is None or waiter.done() or self._skip_partial:
+            # Completes a message that started before the current shot was sent
+            self._skip_partial = False
+            logger.debug("Discarded stale response: %s", response_json)
+            return
+        waiter.set_result(response_json)
+
+    def _dispatch_error(self, error: json.JSONDecodeError) -> None:
+        """Fail the pending shot with a malformed response, or drop the data."""
+        waiter = self._response_waiter
+        if waiter is None or waiter.done() or self._skip_partial:
+            self._skip_partial = False
+            logger.debug("Discarded malformed data: %s", error)
+            return
+        waiter.set_exception(error)
@@ -0,0 +1,30 @@
+# ABOUTME: Tests for the reference GSPro Open Connect Python client.
+# ABOUTME: Skipped unless the gc2_connect package providing the models is installed.
+"""Tests for python_gspro_client."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("gc2_connect.models")
+
+from gc2_connect.models import GC2BallStatus  # noqa: E402
+from python_gspro_client import AsyncGSProClient, GSProClient  # noqa: E402
+
+
+@pytest.mark.parametrize("client_cls", [GSProClient, AsyncGSProClient])
+def test_cancelled_debounce_does_not_block_later_status(client_cls: type) -> None:
+    status = GC2BallStatus(is_ready=True, ball_detected=True)
+
+    async def scenario() -> GC2BallStatus | None:
+        client = client_cls()
+        first = asyncio.create_task(client._debounce_status(status))
+        await asyncio.sleep(0)  # Let it start waiting out the debounce window
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await client._debounce_status(status)
+
+    assert asyncio.run(scenario()) == status
@@ -19,8 +19,10 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import os
 import random
 import struct
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import Callable
@@ -32,6 +34,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Message templates (ASCII bytes), filled with %-formatting per message.
+# Ends with a %s slot for the HMT block and the \n\t message terminator.
+_SHOT_TEMPLATE_NO_SPIN = (
+    b"0H\n"
+    b"SHOT_ID=%d\n"
+    b"TIME_SEC=0\n"
+    b"MSEC_SINCE_CONTACT=%d\n"
+    b"SPEED_MPH=%.2f\n"
+    b"AZIMUTH_DEG=%.2f\n"
+    b"ELEVATION_DEG=%.2f\n"
+    b"SPIN_RPM=%.0f\n"
+    b"IS_LEFT=0\n"
+    b"WORLDSTART_X=-53.53\n"
+    b"WORLDSTART_Y=91.40\n"
+    b"WORLDSTART_Z=-477.94\n"
+    b"%s\n\t"
+)
+_SHOT_TEMPLATE_WITH_SPIN = (
+    b"0H\n"
+    b"SHOT_ID=%d\n"
+    b"TIME_SEC=0\n"
+    b"MSEC_SINCE_CONTACT=%d\n"
+    b"SPEED_MPH=%.2f\n"
+    b"AZIMUTH_DEG=%.2f\n"
+    b"ELEVATION_DEG=%.2f\n"
+    b"SPIN_RPM=%.0f\n"
+    b"BACK_RPM=%.0f\n"
+    b"SIDE_RPM=%.0f\n"
+    b"IS_LEFT=0\n"
+    b"WORLDSTART_X=-53.53\n"
+    b"WORLDSTART_Y=91.40\n"
+    b"WORLDSTART_Z=-477.94\n"
+    b"%s\n\t"
+)
+_NO_HMT = b"HMT=0"
+_STATUS_TEMPLATE_NO_BALL = b"0M\nFLAGS=%d\nBALLS=%d\n\t"
+_STATUS_TEMPLATE_WITH_BALL = b"0M\nFLAGS=%d\nBALLS=%d\nBALL1=198,206,12\n\t"
+
 
 @dataclass
 class ShotData:
@@ -63,6 +103,27 @@ class ShotData:
             side_spin=random.uniform(-500, 500),
         )
 
+    @classmethod
+    def driver_batch(cls, start_id: int, count: int) -> list[ShotData]:
+        """Generate count driver shots with consecutive IDs starting at start_id.
+
+        Scales random.random() directly rather than calling random.uniform six
+        times per shot, which matters for large bursts.
+        """
+        rand = random.random
+        return [
+            cls(
+                shot_id=start_id + i,
+                speed_mph=155 + 20 * rand(),
+                launch_angle=9 + 4 * rand(),
+                direction=-3 + 6 * rand(),
+                total_spin=2200 + 800 * rand(),
+                back_spin=2000 + 800 * rand(),
+                side_spin=-500 + 1000 * rand(),
+            )
+            for i in range(count)
+        ]
+
     @classmethod
     def seven_iron(cls, shot_id: int) -> ShotData:
         """Generate a typical 7-iron shot."""
@@ -99,6 +160,7 @@ class GC2Simulator:
     packet_delay_ms: float = 1.5  # Delay between packets in burst (ms)
     early_reading_delay_ms: float = 200  # Delay before early reading
     final_reading_delay_ms: float = 800  # Additional delay for final reading
+    simulate_timing: bool = True  # False sends each message in one write
     shot_id: int = field(default=0, init=False)
     clients: list[asyncio.StreamWriter] = field(default_factory=list, init=False)
     _server: asyncio.Server | None = field(default=None, init=False)
@@ -109,7 +171,10 @@ class GC2Simulator:
             self._handle_client, "0.0.0.0", self.port
         )
         logger.info(f"GC2 Simulator listening on port {self.port}")
-        logger.info(f"Packet delay: {self.packet_delay_ms}ms between packets")
+        if self.simulate_timing:
+            logger.info(f"Packet delay: {self.packet_delay_ms}ms between packets")
+        else:
+            logger.info("Packet timing disabled: one write per message")
         logger.info("Commands: 'driver', '7iron', 'wedge', 'status', 'quit'")
 
     async def stop(self) -> None:
@@ -132,11 +197,10 @@ class GC2Simulator:
             # Send initial device status (ball detected, ready)
             await self._send_device_status(writer, flags=7, balls=1)
 
-            while True:
-                # Keep connection alive
-                await asyncio.sleep(0.1)
-                if writer.is_closing():
-                    break
+            # Keep connection alive until the client disconnects or we close it.
+            # Anything the client sends is discarded; read() returns b"" on EOF.
+            while await reader.read(4096):
+                pass
         except Exception as e:
             logger.error(f"Client error: {e}")
         finally:
@@ -144,96 +208,95 @@ class GC2Simulator:
             writer.close()
             logger.info(f"Client disconnected: {addr}")
 
-    async def _send_packets(self, writer: asyncio.StreamWriter, data: str) -> None:
+    async def _send_packets(self, writer: asyncio.StreamWriter, encoded: bytes) -> None:
         """Send data as 64-byte USB-style packets with realistic timing."""
-        encoded = data.encode("utf-8")
+        if not self.simulate_timing:
+            # Fast path for tests that don't need USB packet fidelity
+            writer.write(encoded)
+            await writer.drain()
+            logger.info(f"Sent {len(encoded)} bytes in one write")
+            return
+
+        # Slice packets from a memoryview so each 64-byte chunk isn't copied,
+        # and write them straight to the transport (StreamWriter.write only
+        # forwards there); flow control is still checked via drain() below
+        view = memoryview(encoded)
+        transport = writer.transport
         offset = 0
         packet_num = 0
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         while offset < len(encoded):
             # Extract next packet (up to 64 bytes)
-            chunk = encoded[offset : offset + self.packet_size]
+            chunk = view[offset : offset + self.packet_size]
             offset += self.packet_size
             packet_num += 1
 
             # Log packet info
-            logger.debug(
-                f"  Packet {packet_num}: {len(chunk)} bytes: {chunk[:40]}..."
-                if len(chunk) > 40
-                else f"  Packet {packet_num}: {len(chunk)} bytes: {chunk}"
-            )
-
-            # Send packet
-            writer.write(chunk)
-            await writer.drain()
+            if debug:
+                logger.debug(
+                    "  Packet %d: %d bytes: %s%s",
+                    packet_num,
+                    len(chunk),
+                    bytes(chunk[:40]),
+                    "..." if len(chunk) > 40 else "",
+                )
+
+            # Send packet; the inter-packet sleep already yields to the loop,
+            # so flow control only needs checking once per message
+            transport.write(chunk)
 
             # Simulate USB interrupt timing (1-2ms between packets)
             if offset < len(encoded):
                 delay = self.packet_delay_ms / 1000.0
                 await asyncio.sleep(delay)
 
+        await writer.drain()
         logger.info(f"Sent {packet_num} packets, {len(encoded)} bytes total")
 
     def _build_shot_message(
         self, shot: ShotData, msec_since_contact: int, include_spin: bool
-    ) -> str:
+    ) -> bytes:
         """Build a 0H shot message."""
-        lines = [
-            "0H",
-            f"SHOT_ID={shot.shot_id}",
-            f"TIME_SEC=0",
-            f"MSEC_SINCE_CONTACT={msec_since_contact}",
-            f"SPEED_MPH={shot.speed_mph:.2f}",
-            f"AZIMUTH_DEG={shot.direction:.2f}",
-            f"ELEVATION_DEG={shot.launch_angle:.2f}",
-            f"SPIN_RPM={shot.total_spin:.0f}",
-        ]
+        hmt = _NO_HMT if shot.club_speed is None else self._build_hmt_block(shot)
 
         if include_spin:
-            lines.extend(
-                [
-                    f"BACK_RPM={shot.back_spin:.0f}",
-                    f"SIDE_RPM={shot.side_spin:.0f}",
-                ]
+            return _SHOT_TEMPLATE_WITH_SPIN % (
+                shot.shot_id,
+                msec_since_contact,
+                shot.speed_mph,
+                shot.direction,
+                shot.launch_angle,
+                shot.total_spin,
+                shot.back_spin,
+                shot.side_spin,
+                hmt,
             )
-
-        # Add ball position
-        lines.extend(
-            [
-                "IS_LEFT=0",
-                "WORLDSTART_X=-53.53",
-                "WORLDSTART_Y=91.40",
-                "WORLDSTART_Z=-477.94",
-            ]
+        return _SHOT_TEMPLATE_NO_SPIN % (
+            shot.shot_id,
+            msec_since_contact,
+            shot.speed_mph,
+            shot.direction,
+            shot.launch_angle,
+            shot.total_spin,
+            hmt,
         )
 
-        # Add HMT data if present
-        if shot.club_speed is not None:
-            lines.append("HMT=1")
-            lines.append(f"CLUBSPEED_MPH={shot.club_speed:.1f}")
-            if shot.path is not None:
-                lines.append(f"HPATH_DEG={shot.path:.1f}")
-            if shot.attack_angle is not None:
-                lines.append(f"VPATH_DEG={shot.attack_angle:.1f}")
-            if shot.face_to_target is not None:
-                lines.append(f"FACE_T_DEG={shot.face_to_target:.1f}")
-        else:
-            lines.append("HMT=0")
-
-        # Add message terminator (\n\t)
-        return "\n".join(lines) + "\n\t"
-
-    def _build_status_message(self, flags: int, balls: int) -> str:
+    def _build_hmt_block(self, shot: ShotData) -> bytes:
+        """Build the HMT (club data) lines for a shot with club speed."""
+        block = bytearray(b"HMT=1\nCLUBSPEED_MPH=%.1f" % shot.club_speed)
+        if shot.path is not None:
+            block += b"\nHPATH_DEG=%.1f" % shot.path
+        if shot.attack_angle is not None:
+            block += b"\nVPATH_DEG=%.1f" % shot.attack_angle
+        if shot.face_to_target is not None:
+            block += b"\nFACE_T_DEG=%.1f" % shot.face_to_target
+        return bytes(block)
+
+    def _build_status_message(self, flags: int, balls: int) -> bytes:
         """Build a 0M device status message."""
-        lines = [
-            "0M",
-            f"FLAGS={flags}",
-            f"BALLS={balls}",
-        ]
-        if balls > 0:
-            lines.append("BALL1=198,206,12")
-
-        return "\n".join(lines) + "\n\t"
+        template = _STATUS_TEMPLATE_WITH_BALL if balls > 0 else _STATUS_TEMPLATE_NO_BALL
+        return template % (flags, balls)
 
     async def _send_device_status(
         self, writer: asyncio.StreamWriter, flags: int, balls: int
@@ -243,23 +306,31 @@ class GC2Simulator:
         logger.info(f"Sending status: FLAGS={flags}, BALLS={balls}")
         await self._send_packets(writer, message)
 
-    async def fire_shot(self, shot_type: str = "driver") -> None:
-        """Fire a simulated shot to all connected clients."""
+    async def fire_shot(self, shot_type: str = "driver", shot: ShotData | None = None) -> None:
+        """Fire a simulated shot to all connected clients.
+
+        Args:
+            shot_type: Club used to generate the shot and label the log output
+            shot: Pre-generated shot to fire instead (e.g. from driver_batch)
+        """
         if not self.clients:
             logger.warning("No clients connected")
             return
 
-        self.shot_id += 1
-
-        # Create shot based on type
-        if shot_type == "driver":
-            shot = ShotData.driver(self.shot_id)
-        elif shot_type == "7iron":
-            shot = ShotData.seven_iron(self.shot_id)
-        elif shot_type == "wedge":
-            shot = ShotData.wedge(self.shot_id)
+        if shot is not None:
+            self.shot_id = shot.shot_id
         else:
-            shot = ShotData.driver(self.shot_id)
+            self.shot_id += 1
+
+            # Create shot based on type
+            if shot_type == "driver":
+                shot = ShotData.driver(self.shot_id)
+            elif shot_type == "7iron":
+                shot = ShotData.seven_iron(self.shot_id)
+            elif shot_type == "wedge":
+                shot = ShotData.wedge(self.shot_id)
+            else:
+                shot = ShotData.driver(self.shot_id)
 
         logger.info(f"=== FIRING {shot_type.upper()} SHOT #{self.shot_id} ===")
         logger.info(
@@ -271,26 +342,43 @@ class GC2Simulator:
             f"Side: {shot.side_spin:.0f})"
         )
 
-        for writer in self.clients:
-            # === EARLY READING (no spin data) ===
-            logger.info(f"Sending EARLY reading (no spin, {self.early_reading_delay_ms}ms)")
-            early_message = self._build_shot_message(
-                shot, msec_since_contact=200, include_spin=False
-            )
-            await self._send_packets(writer, early_message)
-
-            # Wait before final reading
-            await asyncio.sleep(self.final_reading_delay_ms / 1000.0)
+        # Both readings are identical for every client, so build them once
+        early_message = self._build_shot_message(
+            shot, msec_since_contact=200, include_spin=False
+        )
+        final_message = self._build_shot_message(
+            shot, msec_since_contact=1000, include_spin=True
+        )
 
-            # === FINAL READING (with spin data) ===
-            logger.info("Sending FINAL reading (with spin)")
-            final_message = self._build_shot_message(
-                shot, msec_since_contact=1000, include_spin=True
-            )
-            await self._send_packets(writer, final_message)
+        # Deliver to all clients concurrently, like the GC2 broadcasting to
+        # every listener; one slow or broken client doesn't stall the others
+        writers = list(self.clients)
+        results = await asyncio.gather(
+            *(self._deliver_shot(w, early_message, final_message) for w in writers),
+            return_exceptions=True,
+        )
+        for writer, result in zip(writers, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to deliver shot to client: {result}")
+                writer.close()  # _handle_client drops it from self.clients
 
         logger.info(f"Shot #{self.shot_id} complete")
 
+    async def _deliver_shot(
+        self, writer: asyncio.StreamWriter, early_message: bytes, final_message: bytes
+    ) -> None:
+        """Send the early and final readings of a shot to one client."""
+        # === EARLY READING (no spin data) ===
+        logger.info(f"Sending EARLY reading (no spin, {self.early_reading_delay_ms}ms)")
+        await self._send_packets(writer, early_message)
+
+        # Wait before final reading
+        await asyncio.sleep(self.final_reading_delay_ms / 1000.0)
+
+        # === FINAL READING (with spin data) ===
+        logger.info("Sending FINAL reading (with spin)")
+        await self._send_packets(writer, final_message)
+
     async def send_status(self, ready: bool = True, ball: bool = True) -> None:
         """Send device status to all clients."""
         flags = 7 if ready else 1
@@ -299,6 +387,39 @@ class GC2Simulator:
             await self._send_device_status(writer, flags, balls)
 
 
+def _watch_stdin(loop: asyncio.AbstractEventLoop) -> asyncio.Queue[str | None] | None:
+    """Queue stdin lines from an event loop reader callback (None marks EOF).
+
+    Returns None if stdin can't be watched (Windows event loops, regular
+    files, a closed or replaced stdin), in which case callers should fall
+    back to input() in an executor.
+    """
+    lines: asyncio.Queue[str | None] = asyncio.Queue()
+    pending = bytearray()
+
+    def on_readable() -> None:
+        data = os.read(fd, 4096)
+        if not data:
+            loop.remove_reader(fd)
+            if pending:  # Last line had no trailing newline; input() returns it
+                lines.put_nowait(pending.decode("utf-8", "replace"))
+                pending.clear()
+            lines.put_nowait(None)
+            return
+        pending.extend(data)
+        *complete, rest = pending.split(b"\n")
+        pending[:] = rest
+        for line in complete:
+            lines.put_nowait(line.decode("utf-8", "replace"))
+
+    try:
+        fd = sys.stdin.fileno()
+        loop.add_reader(fd, on_readable)
+    except (NotImplementedError, OSError, AttributeError, ValueError):
+        return None
+    return lines
+
+
 async def command_loop(simulator: GC2Simulator) -> None:
     """Interactive command loop."""
     print("\nGC2 Simulator Ready")
@@ -312,12 +433,19 @@ async def command_loop(simulator: GC2Simulator) -> None:
     print("  quit    - Exit")
     print("=" * 40)
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
+    stdin_lines = _watch_stdin(loop)
 
     while True:
         try:
             # Read command in a non-blocking way
-            cmd = await loop.run_in_executor(None, input, "\n> ")
+            if stdin_lines is not None:
+                print("\n> ", end="", flush=True)
+                cmd = await stdin_lines.get()
+                if cmd is None:
+                    break  # EOF
+            else:
+                cmd = await loop.run_in_executor(None, input, "\n> ")
             cmd = cmd.strip().lower()
 
             if cmd == "quit" or cmd == "q":
@@ -334,8 +462,9 @@ async def command_loop(simulator: GC2Simulator) -> None:
                 parts = cmd.split()
                 count = int(parts[1]) if len(parts) > 1 else 5
                 logger.info(f"Firing burst of {count} shots...")
-                for i in range(count):
-                    await simulator.fire_shot("driver")
+                shots = ShotData.driver_batch(simulator.shot_id + 1, count)
+                for shot in shots:
+                    await simulator.fire_shot("driver", shot)
                     await asyncio.sleep(0.5)  # Short delay between shots
             elif cmd:
                 print(f"Unknown command: {cmd}")
@@ -355,6 +484,11 @@ async def main() -> None:
         default=1.5,
         help="Delay between packets in ms (default: 1.5)",
     )
+    parser.add_argument(
+        "--no-timing",
+        action="store_true",
+        help="Send each message in a single write instead of timed 64-byte packets",
+    )
     parser.add_argument(
         "--early-delay-ms",
         type=float,
@@ -374,6 +508,7 @@ async def main() -> None:
         packet_delay_ms=args.packet_delay_ms,
         early_reading_delay_ms=args.early_delay_ms,
         final_reading_delay_ms=args.final_delay_ms,
+        simulate_timing=not args.no_timing,
     )
 
     await simulator.start()
@@ -21,9 +21,24 @@ import argparse
 import asyncio
 import json
 import logging
+import logging.handlers
+import queue
+import socket
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default event loop
+    uvloop = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s.%(msecs)03d [%(levelname)s] %(message)s",
@@ -31,8 +46,72 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _is_incomplete(error: json.JSONDecodeError) -> bool:
+    """Whether a parse error means more data is needed rather than bad data."""
+    if not error.doc:
+        return False  # orjson reports invalid UTF-8 with an empty doc
+    return error.pos >= len(error.doc) or error.msg.startswith("Unterminated string")
+
+
+# Send buffer for GSPro clients (1 MiB)
+_SEND_BUFFER_BYTES = 1 << 20
+
+# Shared stand-in for a missing ShotDataOptions; only ever read
+_EMPTY_DICT: dict[str, Any] = {}
+
+# GSPro's reply to every shot is the same, so it is encoded once up front
+_SHOT_RESPONSE = _dumps(
+    {
+        "Code": 201,
+        "Message": "Shot received",
+        "Player": {
+            "Handed": "RH",
+            "Club": "DR",
+            "DistanceToTarget": 250,
+        },
+    }
+)
+
+
+def _tune_socket(writer: asyncio.StreamWriter) -> None:
+    """Send shot responses immediately and give bursts room in the kernel."""
+    sock = writer.get_extra_info("socket")
+    if sock is None:
+        return
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_BYTES)
 
-@dataclass
+
+@contextmanager
+def _queued_logging() -> Iterator[None]:
+    """Write log records from a thread so shot reports don't stall reads."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root.handlers = handlers
+
+
+@dataclass(slots=True)
 class MockGSProServer:
     """Mock GSPro Open Connect API server."""
 
@@ -63,8 +142,12 @@ class MockGSProServer:
         """Handle a client connection."""
         addr = writer.get_extra_info("peername")
         logger.info(f"Client connected: {addr}")
+        _tune_socket(writer)
 
-        buffer = ""
+        buffer = bytearray()
+        # Closing braces before this index were already tried as object ends
+        scan_from = 0
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
             while True:
@@ -72,37 +155,43 @@ class MockGSProServer:
                 if not data:
                     break
 
-                buffer += data.decode("utf-8")
-                logger.debug(f"Received {len(data)} bytes, buffer size: {len(buffer)}")
+                buffer += data
+                if debug:
+                    logger.debug(
+                        "Received %d bytes, buffer size: %d", len(data), len(buffer)
+                    )
 
                 # Process complete JSON objects
                 while buffer:
                     try:
                         # Try to parse JSON from buffer
-                        message, end_idx = self._extract_json(buffer)
+                        message, end_idx = self._extract_json(buffer, scan_from)
                         if message is None:
+                            scan_from = end_idx
                             break  # Incomplete JSON, wait for more data
 
-                        buffer = buffer[end_idx:].lstrip()
+                        del buffer[:end_idx]
+                        scan_from = 0
 
                         # Process the message
-                        response = await self._process_message(message)
+                        is_shot = await self._process_message(message)
 
                         # Send response if this was a shot (not heartbeat/status)
-                        if response:
-                            response_json = json.dumps(response)
-                            writer.write(response_json.encode("utf-8"))
+                        if is_shot:
+                            writer.write(_SHOT_RESPONSE)
                             await writer.drain()
-                            logger.debug(f"Sent response: {response_json}")
+                            if debug:
+                                logger.debug("Sent response: %s", _SHOT_RESPONSE)
 
-                    except json.JSONDecodeError as e:
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
                         logger.warning(f"JSON parse error: {e}")
                         # Try to recover by finding next '{'
-                        next_brace = buffer.find("{", 1)
+                        next_brace = buffer.find(b"{", 1)
                         if next_brace > 0:
-                            buffer = buffer[next_brace:]
+                            del buffer[:next_brace]
                         else:
-                            buffer = ""
+                            buffer.clear()
+                        scan_from = 0
                         break
 
         except Exception as e:
@@ -111,79 +200,67 @@ class MockGSProServer:
             writer.close()
             logger.info(f"Client disconnected: {addr}")
 
-    def _extract_json(self, buffer: str) -> tuple[dict[str, Any] | None, int]:
-        """Extract a complete JSON object from the buffer.
+    def _extract_json(
+        self, buffer: bytearray, scan_from: int = 0
+    ) -> tuple[dict[str, Any] | None, int]:
+        """Extract the first complete JSON object from the buffer.
+
+        Each closing brace is tried as the end of the object and the JSON
+        parser (orjson when installed) validates the candidate, instead of
+        tracking depth and string state character by character in Python.
+        Braces before scan_from were already rejected on an earlier call, so
+        a message split across many reads is not rescanned from the start.
+        Only the candidate slice is handed to the parser, so bytes of a
+        message that is still arriving are never decoded.
 
         Returns:
-            (parsed_dict, end_index) or (None, 0) if incomplete
+            (parsed_dict, end_index) or (None, resume_index) if incomplete
+
+        Raises:
+            json.JSONDecodeError: If the buffered data is not valid JSON
         """
-        if not buffer.strip().startswith("{"):
-            # Find the start of JSON
-            start = buffer.find("{")
-            if start < 0:
-                return None, len(buffer)
-            buffer = buffer[start:]
-
-        # Use brace matching to find complete JSON
-        depth = 0
-        in_string = False
-        escape = False
-
-        for i, char in enumerate(buffer):
-            if escape:
-                escape = False
-                continue
-
-            if char == "\\":
-                escape = True
-                continue
-
-            if char == '"':
-                in_string = not in_string
-                continue
-
-            if in_string:
-                continue
-
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    # Found complete JSON
-                    json_str = buffer[: i + 1]
-                    return json.loads(json_str), i + 1
-
-        return None, 0
-
-    async def _process_message(self, message: dict[str, Any]) -> dict[str, Any] | None:
-        """Process a GSPro message and return response."""
-        options = message.get("ShotDataOptions", {})
-
-        is_heartbeat = options.get("IsHeartBeat", False)
-        has_ball_data = options.get("ContainsBallData", False)
-        is_ready = options.get("LaunchMonitorIsReady", False)
-        ball_detected = options.get("LaunchMonitorBallDetected", False)
-
-        if is_heartbeat:
+        start = buffer.find(b"{")
+        if start < 0:
+            return None, 0
+
+        end = buffer.find(b"}", max(start, scan_from))
+        while end >= 0:
+            try:
+                return _loads(buffer[start : end + 1]), end + 1
+            except json.JSONDecodeError as e:
+                if not _is_incomplete(e):
+                    raise
+            end = buffer.find(b"}", end + 1)
+
+        return None, len(buffer)
+
+    async def _process_message(self, message: dict[str, Any]) -> bool:
+        """Process a GSPro message and return whether it needs a shot response."""
+        options = message.get("ShotDataOptions") or _EMPTY_DICT
+
+        # Heartbeats are most of the traffic: count them before reading the
+        # other options, which are only needed for the occasional log line
+        if options.get("IsHeartBeat"):
             self.heartbeat_count += 1
             if self.heartbeat_count % 10 == 1:  # Log every 10th heartbeat
                 logger.info(
                     f"Heartbeat #{self.heartbeat_count} "
-                    f"(Ready: {is_ready}, Ball: {ball_detected})"
+                    f"(Ready: {options.get('LaunchMonitorIsReady', False)}, "
+                    f"Ball: {options.get('LaunchMonitorBallDetected', False)})"
                 )
             # GSPro doesn't respond to heartbeats
-            return None
+            return False
 
-        if not has_ball_data:
+        if not options.get("ContainsBallData"):
             # Status update (not a shot)
             self.status_count += 1
             logger.info(
                 f"Status update #{self.status_count}: "
-                f"Ready={is_ready}, Ball={ball_detected}"
+                f"Ready={options.get('LaunchMonitorIsReady', False)}, "
+                f"Ball={options.get('LaunchMonitorBallDetected', False)}"
             )
             # GSPro doesn't respond to status updates
-            return None
+            return False
 
         # This is a shot
         self.shot_count += 1
@@ -197,47 +274,43 @@ class MockGSProServer:
         vla = ball_data.get("VLA", 0)
         hla = ball_data.get("HLA", 0)
 
-        logger.info("=" * 60)
-        logger.info(f"SHOT #{self.shot_count} RECEIVED")
-        logger.info(f"  Speed:      {speed:.1f} mph")
-        logger.info(f"  VLA:        {vla:.1f}°")
-        logger.info(f"  HLA:        {hla:.1f}°")
-        logger.info(f"  BackSpin:   {back_spin:.0f} rpm")
-        logger.info(f"  SideSpin:   {side_spin:.0f} rpm")
-        logger.info(f"  TotalSpin:  {total_spin:.0f} rpm")
+        # One record per shot: each logger call costs a lock and a write
+        rule = "=" * 60
+        lines = [
+            rule,
+            f"SHOT #{self.shot_count} RECEIVED",
+            f"  Speed:      {speed:.1f} mph",
+            f"  VLA:        {vla:.1f}°",
+            f"  HLA:        {hla:.1f}°",
+            f"  BackSpin:   {back_spin:.0f} rpm",
+            f"  SideSpin:   {side_spin:.0f} rpm",
+            f"  TotalSpin:  {total_spin:.0f} rpm",
+        ]
 
         # Check for the 3500 RPM issue
+        level = logging.WARNING
         if back_spin == 3500 and side_spin == 0:
-            logger.warning("  ⚠️  DEFAULT SPIN DETECTED (3500/0) - Spin data missing!")
+            lines.append("  ⚠️  DEFAULT SPIN DETECTED (3500/0) - Spin data missing!")
         elif back_spin == 0 and side_spin == 0:
-            logger.warning("  ⚠️  ZERO SPIN DETECTED - Possible misread!")
+            lines.append("  ⚠️  ZERO SPIN DETECTED - Possible misread!")
         else:
-            logger.info("  ✓ Spin data looks valid")
+            level = logging.INFO
+            lines.append("  ✓ Spin data looks valid")
 
         # Log club data if present
         club_data = message.get("ClubData", {})
         if club_data:
-            logger.info(f"  Club Speed: {club_data.get('Speed', 0):.1f} mph")
-            logger.info(f"  Path:       {club_data.get('Path', 0):.1f}°")
-            logger.info(f"  Face:       {club_data.get('FaceToTarget', 0):.1f}°")
+            lines.append(f"  Club Speed: {club_data.get('Speed', 0):.1f} mph")
+            lines.append(f"  Path:       {club_data.get('Path', 0):.1f}°")
+            lines.append(f"  Face:       {club_data.get('FaceToTarget', 0):.1f}°")
 
-        logger.info("=" * 60)
+        lines.append(rule)
+        logger.log(level, "\n".join(lines))
 
         # Simulate processing delay
         await asyncio.sleep(self.response_delay_ms / 1000.0)
 
-        # Build response
-        response = {
-            "Code": 201,
-            "Message": "Shot received",
-            "Player": {
-                "Handed": "RH",
-                "Club": "DR",
-                "DistanceToTarget": 250,
-            },
-        }
-
-        return response
+        return True
 
     def print_stats(self) -> None:
         """Print server statistics."""
@@ -260,18 +333,22 @@ async def main() -> None:
         response_delay_ms=args.delay_ms,
     )
 
-    await server.start()
+    with _queued_logging():
+        await server.start()
 
-    try:
-        if server._server:
-            await server._server.serve_forever()
-    except KeyboardInterrupt:
-        pass
-    finally:
-        server.print_stats()
-        await server.stop()
-        logger.info("Server stopped")
+        try:
+            if server._server:
+                await server._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.print_stats()
+            await server.stop()
+            logger.info("Server stopped")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(
+        loop_factory=uvloop.new_event_loop if uvloop is not None else None
+    ) as runner:
+        runner.run(main())
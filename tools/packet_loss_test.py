@@ -25,10 +25,20 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import logging.handlers
+import queue
 import random
+import socket
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default event loop
+    uvloop = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s.%(msecs)03d [%(levelname)s] %(message)s",
@@ -36,8 +46,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Room for a whole burst of packets in the kernel send buffer
+_SEND_BUFFER_BYTES = 1 << 20
+
+# asyncio.sleep() cannot wait much less than the ~1ms timer resolution of the
+# event loop, so shorter packet delays spin on the clock instead
+_SPIN_BELOW_NS = 1_000_000
+
+# Message templates (ASCII bytes), filled with %-formatting per message
+_SHOT_TEMPLATE_NO_SPIN = (
+    b"0H\n"
+    b"SHOT_ID=%d\n"
+    b"TIME_SEC=0\n"
+    b"MSEC_SINCE_CONTACT=%d\n"
+    b"SPEED_MPH=%.2f\n"
+    b"AZIMUTH_DEG=%.2f\n"
+    b"ELEVATION_DEG=%.2f\n"
+    b"SPIN_RPM=%.0f\n"
+    b"IS_LEFT=0\n"
+    b"WORLDSTART_X=-53.53\n"
+    b"WORLDSTART_Y=91.40\n"
+    b"WORLDSTART_Z=-477.94\n"
+    b"HMT=0\n\t"
+)
+_SHOT_TEMPLATE_WITH_SPIN = (
+    b"0H\n"
+    b"SHOT_ID=%d\n"
+    b"TIME_SEC=0\n"
+    b"MSEC_SINCE_CONTACT=%d\n"
+    b"SPEED_MPH=%.2f\n"
+    b"AZIMUTH_DEG=%.2f\n"
+    b"ELEVATION_DEG=%.2f\n"
+    b"SPIN_RPM=%.0f\n"
+    b"BACK_RPM=%.0f\n"
+    b"SIDE_RPM=%.0f\n"
+    b"IS_LEFT=0\n"
+    b"WORLDSTART_X=-53.53\n"
+    b"WORLDSTART_Y=91.40\n"
+    b"WORLDSTART_Z=-477.94\n"
+    b"HMT=0\n\t"
+)
+
+
+def _tune_socket(writer: asyncio.StreamWriter) -> None:
+    """Keep stress packets unbatched (TCP_NODELAY is also asyncio's default)."""
+    sock = writer.get_extra_info("socket")
+    if sock is None:
+        return
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_BYTES)
+
 
-@dataclass
+@contextmanager
+def _queued_logging() -> Iterator[None]:
+    """Route logging through a queue so stderr writes never delay a packet."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root.handlers = handlers
+
+
+@dataclass(slots=True)
 class StressTestStats:
     """Statistics from stress test."""
 
@@ -63,7 +141,7 @@ class StressTestStats:
         logger.info("=" * 60)
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketLossStressTester:
     """Stress tester for packet loss detection."""
 
@@ -73,7 +151,8 @@ class PacketLossStressTester:
     inter_shot_delay_ms: float = 100  # Delay between shots
     stats: StressTestStats = field(default_factory=StressTestStats)
     _server: asyncio.Server | None = field(default=None, init=False)
-    _clients: list[asyncio.StreamWriter] = field(default_factory=list, init=False)
+    # Keyed by id(writer) for O(1) removal; dicts keep connection order
+    _clients: dict[int, asyncio.StreamWriter] = field(default_factory=dict, init=False)
 
     async def start(self) -> None:
         """Start the test server."""
@@ -88,7 +167,7 @@ class PacketLossStressTester:
         if self._server:
             self._server.close()
             await self._server.wait_closed()
-        for client in self._clients:
+        for client in self._clients.values():
             client.close()
 
     async def _handle_client(
@@ -97,40 +176,62 @@ class PacketLossStressTester:
         """Handle client connection."""
         addr = writer.get_extra_info("peername")
         logger.info(f"Client connected: {addr}")
-        self._clients.append(writer)
+        _tune_socket(writer)
+        self._clients[id(writer)] = writer
 
         try:
-            while True:
-                await asyncio.sleep(0.1)
-                if writer.is_closing():
-                    break
+            # Keep connection alive until the client disconnects or we close it.
+            # Anything the client sends is discarded; read() returns b"" on EOF.
+            while await reader.read(4096):
+                pass
         except Exception as e:
             logger.error(f"Client error: {e}")
         finally:
-            if writer in self._clients:
-                self._clients.remove(writer)
+            self._clients.pop(id(writer), None)
             writer.close()
             logger.info(f"Client disconnected: {addr}")
 
-    async def _send_packets(self, writer: asyncio.StreamWriter, data: str) -> int:
+    async def _send_packets(self, writer: asyncio.StreamWriter, encoded: bytes) -> int:
         """Send data as packets with stress timing."""
-        encoded = data.encode("utf-8")
-        offset = 0
-        packet_count = 0
-
-        while offset < len(encoded):
-            chunk = encoded[offset : offset + self.packet_size]
-            offset += self.packet_size
-            packet_count += 1
-
-            writer.write(chunk)
+        # Locals for everything the per-packet loop touches. Packets are
+        # memoryview slices, so no chunk of the message is copied.
+        view = memoryview(encoded)
+        packet_size = self.packet_size
+        total = len(encoded)
+        packet_count = (total + packet_size - 1) // packet_size
+        delay_ns = int(self.packet_delay_ms * 1_000_000)
+
+        if delay_ns <= 0:
+            # Nothing to pace: hand every packet to the transport at once
+            chunks = [view[i : i + packet_size] for i in range(0, total, packet_size)]
+            writer.writelines(chunks)
             await writer.drain()
+        else:
+            write = writer.write
+            sleep = asyncio.sleep
+            perf_counter_ns = time.perf_counter_ns
+            spin = delay_ns < _SPIN_BELOW_NS
+            delay_s = delay_ns / 1e9
+            last = total - packet_size
+
+            for offset in range(0, total, packet_size):
+                # The transport sends right away while its buffer is empty;
+                # the pacing below yields to the loop, so one drain suffices
+                write(view[offset : offset + packet_size])
+
+                if offset < last:
+                    if spin:
+                        # Yield on every spin so other clients keep being served
+                        deadline_ns = perf_counter_ns() + delay_ns
+                        while perf_counter_ns() < deadline_ns:
+                            await sleep(0)
+                    else:
+                        await sleep(delay_s)
 
-            if offset < len(encoded) and self.packet_delay_ms > 0:
-                await asyncio.sleep(self.packet_delay_ms / 1000.0)
+            await writer.drain()
 
         self.stats.packets_sent += packet_count
-        self.stats.bytes_sent += len(encoded)
+        self.stats.bytes_sent += total
         return packet_count
 
     def _build_shot_message(
@@ -144,39 +245,28 @@ class PacketLossStressTester:
         total_spin: float,
         msec: int,
         include_spin: bool,
-    ) -> str:
+    ) -> bytes:
         """Build a shot message with unique spin values for tracking."""
-        lines = [
-            "0H",
-            f"SHOT_ID={shot_id}",
-            "TIME_SEC=0",
-            f"MSEC_SINCE_CONTACT={msec}",
-            f"SPEED_MPH={speed:.2f}",
-            f"AZIMUTH_DEG={direction:.2f}",
-            f"ELEVATION_DEG={launch:.2f}",
-            f"SPIN_RPM={total_spin:.0f}",
-        ]
-
         if include_spin:
-            lines.extend(
-                [
-                    f"BACK_RPM={back_spin:.0f}",
-                    f"SIDE_RPM={side_spin:.0f}",
-                ]
+            return _SHOT_TEMPLATE_WITH_SPIN % (
+                shot_id,
+                msec,
+                speed,
+                direction,
+                launch,
+                total_spin,
+                back_spin,
+                side_spin,
             )
-
-        lines.extend(
-            [
-                "IS_LEFT=0",
-                "WORLDSTART_X=-53.53",
-                "WORLDSTART_Y=91.40",
-                "WORLDSTART_Z=-477.94",
-                "HMT=0",
-            ]
+        return _SHOT_TEMPLATE_NO_SPIN % (
+            shot_id,
+            msec,
+            speed,
+            direction,
+            launch,
+            total_spin,
         )
 
-        return "\n".join(lines) + "\n\t"
-
     async def run_test(self, num_shots: int) -> None:
         """Run the stress test."""
         if not self._clients:
@@ -187,12 +277,18 @@ class PacketLossStressTester:
         logger.info(f"Starting stress test with {num_shots} shots...")
         logger.info(f"Packet delay: {self.packet_delay_ms}ms")
 
-        for shot_id in range(1, num_shots + 1):
+        # Draw the random ball data for every shot before sending starts, so
+        # RNG calls stay out of the paced loop. Scaling random.random() is
+        # the same distribution as random.uniform without the extra call.
+        rand = random.random
+        ball_data = [
+            (140.0 + 20.0 * rand(), 10.0 + 4.0 * rand(), -3.0 + 6.0 * rand())
+            for _ in range(num_shots)
+        ]
+
+        for shot_id, (speed, launch, direction) in enumerate(ball_data, start=1):
             # Generate unique spin values for this shot (for tracking)
             # Use shot_id in the spin values so we can verify the correct data arrives
-            speed = 150.0 + random.uniform(-10, 10)
-            launch = 12.0 + random.uniform(-2, 2)
-            direction = random.uniform(-3, 3)
             back_spin = 2500.0 + shot_id  # Unique back spin!
             side_spin = -200.0 + shot_id  # Unique side spin!
             total_spin = back_spin + abs(side_spin)
@@ -201,13 +297,21 @@ class PacketLossStressTester:
                 f"Shot {shot_id}/{num_shots}: BackSpin={back_spin:.0f}, SideSpin={side_spin:.0f}"
             )
 
-            for writer in self._clients:
+            # Every client gets the same bytes, so build both readings once
+            early_msg = self._build_shot_message(
+                shot_id, speed, launch, direction,
+                back_spin, side_spin, total_spin,
+                msec=200, include_spin=False
+            )
+            final_msg = self._build_shot_message(
+                shot_id, speed, launch, direction,
+                back_spin, side_spin, total_spin,
+                msec=1000, include_spin=True
+            )
+
+            # Snapshot: a client can disconnect while this shot is being sent
+            for writer in list(self._clients.values()):
                 # Send early reading (no spin)
-                early_msg = self._build_shot_message(
-                    shot_id, speed, launch, direction,
-                    back_spin, side_spin, total_spin,
-                    msec=200, include_spin=False
-                )
                 await self._send_packets(writer, early_msg)
                 self.stats.early_readings_sent += 1
 
@@ -215,11 +319,6 @@ class PacketLossStressTester:
                 await asyncio.sleep(0.05)
 
                 # Send final reading (with spin)
-                final_msg = self._build_shot_message(
-                    shot_id, speed, launch, direction,
-                    back_spin, side_spin, total_spin,
-                    msec=1000, include_spin=True
-                )
                 await self._send_packets(writer, final_msg)
                 self.stats.final_readings_sent += 1
 
@@ -257,24 +356,30 @@ async def main() -> None:
         inter_shot_delay_ms=args.inter_shot_delay_ms,
     )
 
-    await tester.start()
+    with _queued_logging():
+        await tester.start()
 
-    logger.info("Waiting for Unity app to connect...")
-    logger.info("(Start Unity, open GC2 Test Window, set to Client mode, connect to localhost:5555)")
+        try:
+            logger.info("Waiting for Unity app to connect...")
+            logger.info("(Start Unity, open GC2 Test Window, set to Client mode, connect to localhost:5555)")
 
-    # Wait for client
-    while not tester._clients:
-        await asyncio.sleep(0.5)
+            # Wait for client
+            while not tester._clients:
+                await asyncio.sleep(0.5)
 
-    logger.info("Client connected! Starting test in 2 seconds...")
-    await asyncio.sleep(2)
+            logger.info("Client connected! Starting test in 2 seconds...")
+            await asyncio.sleep(2)
 
-    await tester.run_test(args.shots)
+            await tester.run_test(args.shots)
 
-    # Keep server running for a bit to allow final messages
-    await asyncio.sleep(2)
-    await tester.stop()
+            # Keep server running for a bit to allow final messages
+            await asyncio.sleep(2)
+        finally:
+            await tester.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(
+        loop_factory=uvloop.new_event_loop if uvloop is not None else None
+    ) as runner:
+        runner.run(main())